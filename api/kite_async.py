@@ -0,0 +1,102 @@
+"""
+Async Kite quote endpoints.
+Batches of instruments are fetched concurrently over aiohttp so a large
+watchlist costs roughly one round trip instead of one per batch.
+"""
+
+import asyncio
+import threading
+from typing import Dict, List
+
+import aiohttp
+
+KITE_ROOT = 'https://api.kite.trade'
+KITE_VERSION = '3'
+MAX_INSTRUMENTS_PER_REQUEST = 500  # Kite limit for /quote/ltp
+REQUEST_TIMEOUT_SECONDS = 7
+
+
+async def _fetch_ltp(session: aiohttp.ClientSession, root: str, instruments: List[str]) -> Dict[str, Dict]:
+    """Fetch one batch from /quote/ltp"""
+    params = [('i', instrument) for instrument in instruments]
+
+    async with session.get(f"{root}/quote/ltp", params=params) as response:
+        payload = await response.json(content_type=None)
+
+    if payload.get('status') != 'success':
+        raise RuntimeError(payload.get('message', f"Kite LTP request failed ({response.status})"))
+
+    return payload['data']
+
+
+async def _ltp_many(session: aiohttp.ClientSession, root: str, instruments: List[str],
+                    chunk_size: int) -> Dict[str, Dict]:
+    """Fetch all batches concurrently and merge them"""
+    batches = [instruments[i:i + chunk_size] for i in range(0, len(instruments), chunk_size)]
+    results = await asyncio.gather(*(_fetch_ltp(session, root, batch) for batch in batches))
+
+    ltp_data = {}
+    for data in results:
+        ltp_data.update(data)
+
+    return ltp_data
+
+
+class KiteAsyncSession:
+    """
+    One long-lived aiohttp session on a dedicated event-loop thread.
+    Callers on any thread submit work to it, so connections (TCP + TLS)
+    and DNS lookups are reused across calls instead of rebuilt per fetch.
+    """
+
+    def __init__(self, api_key: str, access_token: str, root: str = KITE_ROOT):
+        """
+        Args:
+            api_key: Kite API key
+            access_token: Kite session access token
+            root: Kite API root URL
+        """
+        self.root = root
+        self._headers = {
+            'X-Kite-Version': KITE_VERSION,
+            'Authorization': f"token {api_key}:{access_token}"
+        }
+
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name='kite-async', daemon=True)
+        self._thread.start()
+
+        # The session must be created on the loop that will use it
+        self._session = asyncio.run_coroutine_threadsafe(self._open(), self._loop).result()
+
+    async def _open(self) -> aiohttp.ClientSession:
+        connector = aiohttp.TCPConnector(limit=16, ttl_dns_cache=300)
+        timeout = aiohttp.ClientTimeout(total=REQUEST_TIMEOUT_SECONDS)
+        return aiohttp.ClientSession(connector=connector, headers=self._headers, timeout=timeout)
+
+    def ltp_many(self, instruments: List[str], chunk_size: int = MAX_INSTRUMENTS_PER_REQUEST) -> Dict[str, Dict]:
+        """
+        Get LTP for any number of instruments.
+
+        Args:
+            instruments: Instruments in exchange:symbol format (e.g. 'NSE:INFY')
+            chunk_size: Max instruments per HTTP request
+
+        Returns:
+            Same shape as KiteConnect.ltp: {instrument: {'instrument_token', 'last_price'}}
+        """
+        future = asyncio.run_coroutine_threadsafe(
+            _ltp_many(self._session, self.root, instruments, chunk_size), self._loop
+        )
+        # Each request is bounded by the session timeout; this only guards a stuck loop
+        return future.result(timeout=REQUEST_TIMEOUT_SECONDS * 2)
+
+    def close(self):
+        """Close the session and stop the loop thread"""
+        if self._loop.is_closed():
+            return
+
+        asyncio.run_coroutine_threadsafe(self._session.close(), self._loop).result()
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join()
+        self._loop.close()
@@ -1,8 +1,75 @@
 from kiteconnect import KiteConnect
+from kiteconnect.exceptions import KiteException, NetworkException
+from api.kite_async import KiteAsyncSession
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from datetime import datetime, timedelta
+import csv
+import functools
+import os
+import pickle
+import time
+from types import MappingProxyType
 import pandas as pd
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
 import numpy as np
+import requests
+import threading
+import config
+
+
+def create_session() -> requests.Session:
+    """
+    Keep-alive HTTP session for KiteConnect.
+    Pooled connections skip the TCP + TLS handshake on every API call.
+    """
+    session = requests.Session()
+    adapter = HTTPAdapter(
+        pool_connections=16,
+        pool_maxsize=16,
+        max_retries=Retry(total=3, backoff_factor=0.2)
+    )
+    session.mount('https://', adapter)
+    return session
+
+
+class RateLimiter:
+    """
+    Spaces calls to at most `rate` per second, shared across threads.
+    Each acquire reserves the next free slot and sleeps until it arrives.
+    """
+    
+    def __init__(self, rate: float):
+        self._interval = 1.0 / rate
+        self._next_slot = 0.0
+        self._lock = threading.Lock()
+    
+    def acquire(self, count: int = 1):
+        with self._lock:
+            now = time.monotonic()
+            slot = max(now, self._next_slot)
+            self._next_slot = slot + self._interval * count
+        
+        if slot > now:
+            time.sleep(slot - now)
+
+
+def _is_retryable(error: Exception) -> bool:
+    """Rate-limit (429) and transient network failures are worth retrying"""
+    if isinstance(error, (NetworkException, requests.ConnectionError, requests.Timeout)):
+        return True
+    return isinstance(error, KiteException) and error.code == 429
+
+
+@functools.lru_cache(maxsize=32)
+def _decorate_nse(symbols: tuple) -> List[str]:
+    """
+    Exchange-qualified instrument list for a tuple of symbols.
+    Cached so stable watchlists don't rebuild it every poll; callers must not mutate it.
+    """
+    return [f"NSE:{symbol}" for symbol in symbols]
+
 
 class KiteClient:
     """
@@ -10,24 +77,136 @@ class KiteClient:
     Handles historical data (Fetch Day) and live prices (Execute Day).
     """
     
-    def __init__(self, api_key: str, access_token: str):
+    # Parallel historical_data requests for batch fetches; the rate limiter
+    # is what actually paces them, so more workers than that buys nothing
+    HISTORICAL_WORKERS = 3
+    
+    # Max instruments per ltp/quote request (Kite limit)
+    CHUNK = 500
+    
+    # Length of the "NSE:" exchange prefix on instrument keys
+    PREFIX_LEN = len('NSE:')
+    
+    # Base prices for mock candles / LTP when the API is unavailable
+    MOCK_BASE_PRICES = {
+        'HINDZINC': 715.20,
+        'TATASTEEL': 202.32,
+        'RELIANCE': 1391.00,
+        'INFY': 1659.50,
+        'TCS': 3144.40,
+        'HDFCBANK': 935.50,
+        'MRF': 130915.00
+    }
+    
+    def __init__(self, api_key: str, access_token: str, background_load: bool = False):
+        """
+        Args:
+            api_key: Kite API key
+            access_token: Kite session access token
+            background_load: Load instrument tokens on a daemon thread instead
+                of blocking the constructor
+        """
         self.kite = KiteConnect(api_key=api_key)
+        self.kite.reqsession = create_session()
         self.kite.set_access_token(access_token)
         self.instruments_cache = {}
-        self._load_instruments()
+        self._tokens = MappingProxyType(self.instruments_cache)  # read-only view for worker threads
+        self._instruments_ready = threading.Event()  # set once loading finishes (or fails)
+        self._ltp_cache: Dict[str, tuple] = {}  # symbol -> (fetched_at, price); price None = Kite had none
+        self._historical_limiter = RateLimiter(config.Config.HISTORICAL_REQUESTS_PER_SECOND)
+        self._ltp_session: Optional[KiteAsyncSession] = None  # created on first LTP fetch
+        self._ltp_session_lock = threading.Lock()
+        
+        # Background LTP refresher state (snapshot is replaced whole, never mutated)
+        self._subscribed: Dict[str, float] = {}  # symbol -> last requested (monotonic)
+        self._ltp_snapshot: Dict[str, float] = {}
+        self._snapshot_at = 0.0
+        self._refresher: Optional[threading.Thread] = None
+        self._subscribe_lock = threading.Lock()
+        self._stopped = threading.Event()
+        
+        # Symbols the refresher is currently fetching; get_ltp waits on it instead of duplicating the request
+        self._refresh_pending: frozenset = frozenset()
+        self._refresh_cond = threading.Condition()
+        
+        # Refresher polls and direct fetches share the quote endpoint's rate limit
+        self._quote_limiter = RateLimiter(config.Config.QUOTE_REQUESTS_PER_SECOND)
+        
+        if background_load:
+            threading.Thread(target=self._load_instruments, name='instruments-loader', daemon=True).start()
+        else:
+            self._load_instruments()
+    
+    def _instruments_cache_path(self) -> str:
+        """Daily pickle of the NSE symbol -> token map"""
+        filename = f"instruments_NSE_{datetime.now().strftime('%Y%m%d')}.pkl"
+        return os.path.join(config.Config.INSTRUMENTS_CACHE_DIR, filename)
     
     def _load_instruments(self):
-        """Load and cache instrument tokens"""
+        """Load instrument tokens, then release anyone waiting on them"""
         try:
-            instruments = self.kite.instruments("NSE")
-            for inst in instruments:
-                self.instruments_cache[inst['tradingsymbol']] = inst['instrument_token']
+            self._read_instruments()
+        finally:
+            self._instruments_ready.set()
+    
+    def _read_instruments(self):
+        """Load and cache instrument tokens (disk cache valid for the trading day)"""
+        cache_path = self._instruments_cache_path()
+        
+        try:
+            age = time.time() - os.path.getmtime(cache_path)
+            if age < config.Config.INSTRUMENTS_CACHE_TTL_SECONDS:
+                with open(cache_path, 'rb') as f:
+                    self.instruments_cache = pickle.load(f)
+                self._tokens = MappingProxyType(self.instruments_cache)
+                print(f"✓ Loaded {len(self.instruments_cache)} NSE instruments from cache")
+                return
+        except (OSError, pickle.UnpicklingError, EOFError):
+            pass
+        
+        try:
+            self.instruments_cache = self._stream_instruments("NSE")
+            self._tokens = MappingProxyType(self.instruments_cache)
             print(f"✓ Loaded {len(self.instruments_cache)} NSE instruments")
         except Exception as e:
             print(f"Warning: Could not load instruments: {e}")
             print("Using mock data mode for testing")
+            return
+        
+        try:
+            os.makedirs(config.Config.INSTRUMENTS_CACHE_DIR, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(self.instruments_cache, f, protocol=pickle.HIGHEST_PROTOCOL)
+        except OSError as e:
+            print(f"Warning: Could not write instruments cache: {e}")
+    
+    def _stream_instruments(self, exchange: str) -> Dict[str, int]:
+        """
+        Stream the instruments CSV and keep only symbol -> token.
+        Avoids materializing a dict per instrument like kite.instruments() does.
+        """
+        headers = {
+            'X-Kite-Version': self.kite.kite_header_version,
+            'Authorization': f"token {self.kite.api_key}:{self.kite.access_token}"
+        }
+        
+        with self.kite.reqsession.get(
+            f"{self.kite.root}/instruments/{exchange}",
+            headers=headers,
+            timeout=self.kite.timeout,
+            stream=True
+        ) as response:
+            response.raise_for_status()
+            response.encoding = response.encoding or 'utf-8'
+            
+            tokens = {}
+            for row in csv.DictReader(response.iter_lines(decode_unicode=True)):
+                tokens[row['tradingsymbol']] = int(row['instrument_token'])
+            
+            return tokens
     
-    def get_historical_data(self, symbol: str, from_date: str, to_date: str, interval: str) -> pd.DataFrame:
+    def get_historical_data(self, symbol: str, from_date: str, to_date: str, interval: str,
+                            as_dataframe: bool = False, allow_mock: bool = True) -> Union[List[Dict], pd.DataFrame]:
         """
         Fetch historical OHLC data for Fetch Day.
         
@@ -36,49 +215,132 @@ class KiteClient:
             from_date: Start date (YYYY-MM-DD)
             to_date: End date (YYYY-MM-DD)
             interval: '5minute', '10minute', '15minute', 'day'
+            as_dataframe: Return a DataFrame instead of the raw candle list
+            allow_mock: Fall back to mock candles when the API is unavailable
+                (otherwise return no candles)
         
         Returns:
-            DataFrame with columns: date, open, high, low, close, volume
+            List of candle dicts (date, open, high, low, close, volume),
+            or a DataFrame with those columns if as_dataframe is set.
+            Mock DataFrames carry attrs['mock'] = True.
         """
         try:
             instrument_token = self._get_instrument_token(symbol)
-            
+        except TimeoutError as e:
+            # Tokens are still loading - mock candles here would look like real data
+            print(f"Warning: {e}; no data for {symbol}")
+            return self._fallback_candles(symbol, from_date, to_date, interval, as_dataframe, allow_mock=False)
+        
+        try:
             if instrument_token == 0:
-                print(f"Warning: No instrument token for {symbol}, using mock data")
-                return self._generate_mock_data(symbol, from_date, to_date, interval)
+                print(f"Warning: No instrument token for {symbol}")
+                return self._fallback_candles(symbol, from_date, to_date, interval, as_dataframe, allow_mock)
             
-            from_dt = datetime.strptime(from_date, '%Y-%m-%d')
-            to_dt = datetime.strptime(to_date, '%Y-%m-%d') + timedelta(days=1)
+            from_dt = datetime.fromisoformat(from_date)
+            to_dt = datetime.fromisoformat(to_date) + timedelta(days=1)
             
-            data = self.kite.historical_data(
-                instrument_token=instrument_token,
-                from_date=from_dt,
-                to_date=to_dt,
-                interval=interval
-            )
+            data = self._historical_data(instrument_token, from_dt, to_dt, interval)
             
-            df = pd.DataFrame(data)
-            return df
+            if as_dataframe:
+                return self._candles_to_dataframe(data)
+            return data
         
         except Exception as e:
             print(f"Error fetching historical data for {symbol}: {e}")
-            print(f"Falling back to mock data for testing")
-            return self._generate_mock_data(symbol, from_date, to_date, interval)
+            return self._fallback_candles(symbol, from_date, to_date, interval, as_dataframe, allow_mock)
     
-    def _generate_mock_data(self, symbol: str, from_date: str, to_date: str, interval: str) -> pd.DataFrame:
-        """Generate realistic mock OHLC data for testing"""
-        # Base prices for common stocks
-        base_prices = {
-            'HINDZINC': 715,
-            'TATASTEEL': 202,
-            'RELIANCE': 1391,
-            'INFY': 1659,
-            'TCS': 3144,
-            'HDFCBANK': 935,
-            'MRF': 130915
+    def _historical_data(self, instrument_token: int, from_dt: datetime, to_dt: datetime, interval: str) -> List[Dict]:
+        """
+        historical_data paced to the API rate limit.
+        Retries 429s and network errors with exponential backoff.
+        """
+        retries = config.Config.HISTORICAL_RETRIES
+        
+        for attempt in range(retries + 1):
+            self._historical_limiter.acquire()
+            try:
+                return self.kite.historical_data(
+                    instrument_token=instrument_token,
+                    from_date=from_dt,
+                    to_date=to_dt,
+                    interval=interval
+                )
+            except Exception as e:
+                if attempt == retries or not _is_retryable(e):
+                    raise
+                time.sleep(config.Config.HISTORICAL_RETRY_BACKOFF_SECONDS * 2 ** attempt)
+    
+    def _fallback_candles(self, symbol: str, from_date: str, to_date: str, interval: str,
+                          as_dataframe: bool, allow_mock: bool) -> Union[List[Dict], pd.DataFrame]:
+        """Mock candles when allowed, otherwise an empty result of the requested shape"""
+        if not allow_mock:
+            return self._candles_to_dataframe([]) if as_dataframe else []
+        
+        print(f"Falling back to mock data for {symbol}")
+        return self._mock_candles(symbol, from_date, to_date, interval, as_dataframe)
+    
+    def _mock_candles(self, symbol: str, from_date: str, to_date: str, interval: str,
+                      as_dataframe: bool) -> Union[List[Dict], pd.DataFrame]:
+        """Mock data in the same shape get_historical_data would return"""
+        df = self._generate_mock_data(symbol, from_date, to_date, interval)
+        if not as_dataframe:
+            return df.to_dict('records')
+        
+        # Lets callers tell generated candles from real ones
+        df.attrs['mock'] = True
+        return df
+    
+    @staticmethod
+    def _candles_to_dataframe(data: List[Dict]) -> pd.DataFrame:
+        """
+        Build the OHLC frame column-wise with explicit dtypes.
+        Skips pandas' per-row dict inference on the list of candles.
+        """
+        n = len(data)
+        columns = {
+            'date': [row['date'] for row in data],
+            'open': np.fromiter((row['open'] for row in data), dtype=np.float64, count=n),
+            'high': np.fromiter((row['high'] for row in data), dtype=np.float64, count=n),
+            'low': np.fromiter((row['low'] for row in data), dtype=np.float64, count=n),
+            'close': np.fromiter((row['close'] for row in data), dtype=np.float64, count=n),
+            'volume': np.fromiter((row['volume'] for row in data), dtype=np.int64, count=n)
         }
+        return pd.DataFrame(columns, copy=False)
+    
+    def get_historical_data_batch(self, symbols: List[str], from_date: str, to_date: str, interval: str,
+                                  as_dataframe: bool = False, allow_mock: bool = True) -> Dict[str, Union[List[Dict], pd.DataFrame]]:
+        """
+        Fetch historical OHLC data for many symbols concurrently.
+        
+        Instrument tokens resolve from the local cache, so the only network
+        work is one historical_data call per symbol, issued in parallel and
+        paced to the historical API rate limit.
+        
+        Returns:
+            Dict mapping symbol to candles (same shape as get_historical_data)
+        """
+        if not symbols:
+            return {}
         
-        base_price = base_prices.get(symbol, 1000)
+        # Wait for tokens once here rather than once per worker
+        if not self._instruments_ready.wait(config.Config.INSTRUMENTS_LOAD_TIMEOUT_SECONDS):
+            print(f"Warning: instrument tokens still loading; no data for {len(symbols)} symbols")
+            return {
+                symbol: self._fallback_candles(symbol, from_date, to_date, interval, as_dataframe, allow_mock=False)
+                for symbol in symbols
+            }
+        
+        workers = min(self.HISTORICAL_WORKERS, len(symbols))
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            futures = {
+                symbol: executor.submit(self.get_historical_data, symbol, from_date, to_date, interval, as_dataframe, allow_mock)
+                for symbol in symbols
+            }
+            return {symbol: future.result() for symbol, future in futures.items()}
+    
+    def _generate_mock_data(self, symbol: str, from_date: str, to_date: str, interval: str) -> pd.DataFrame:
+        """Generate realistic mock OHLC data for testing"""
+        base_price = self.MOCK_BASE_PRICES.get(symbol, 1000)
         
         # Generate intraday data
         if interval in ['5minute', '10minute', '15minute']:
@@ -86,96 +348,266 @@ class KiteClient:
         else:
             num_candles = 1
         
-        data = []
-        current_price = base_price
+        rng = np.random.default_rng()
+        
+        # Random walk around base price, generated column-wise in one pass
+        walk = rng.standard_normal(num_candles) * (base_price * 0.01)
+        current = base_price + np.cumsum(walk)
+        
+        highs = current + np.abs(rng.standard_normal(num_candles)) * base_price * 0.005
+        lows = current - np.abs(rng.standard_normal(num_candles)) * base_price * 0.005
+        opens = current + rng.standard_normal(num_candles) * base_price * 0.003
+        closes = current + rng.standard_normal(num_candles) * base_price * 0.003
+        volumes = rng.integers(10000, 100000, num_candles)
         
-        for i in range(num_candles):
-            # Simulate price movement
-            change = np.random.randn() * (base_price * 0.01)
-            current_price += change
+        return pd.DataFrame({
+            'date': pd.date_range(from_date, periods=num_candles, freq='15min'),
+            'open': np.round(opens, 2),
+            'high': np.round(highs, 2),
+            'low': np.round(lows, 2),
+            'close': np.round(closes, 2),
+            'volume': volumes
+        })
+    
+    def subscribe(self, symbols: List[str]):
+        """
+        Mark symbols as requested now, keeping them in the background LTP refresh set.
+        Symbols not requested for LTP_SUBSCRIPTION_IDLE_SECONDS are dropped.
+        Starts the refresher thread when it isn't running.
+        """
+        with self._subscribe_lock:
+            now = time.monotonic()
+            for symbol in symbols:
+                self._subscribed[symbol] = now
             
-            high = current_price + abs(np.random.randn() * base_price * 0.005)
-            low = current_price - abs(np.random.randn() * base_price * 0.005)
-            open_price = current_price + np.random.randn() * base_price * 0.003
-            close_price = current_price + np.random.randn() * base_price * 0.003
+            if self._refresher is None and not self._stopped.is_set():
+                self._refresher = threading.Thread(target=self._ltp_refresher, name='ltp-refresher', daemon=True)
+                self._refresher.start()
+    
+    def _active_symbols(self) -> List[str]:
+        """
+        Drop idle subscriptions and return the rest.
+        When nothing is left the refresher is marked as gone (under the lock,
+        so a concurrent subscribe starts a new one).
+        """
+        with self._subscribe_lock:
+            cutoff = time.monotonic() - config.Config.LTP_SUBSCRIPTION_IDLE_SECONDS
+            self._subscribed = {
+                symbol: requested_at
+                for symbol, requested_at in self._subscribed.items()
+                if requested_at >= cutoff
+            }
+            if not self._subscribed or self._stopped.is_set():
+                self._refresher = None
+                return []
+            return sorted(self._subscribed)
+    
+    def _ltp_refresher(self):
+        """Poll LTP for subscribed symbols and publish a fresh snapshot; exits when idle or stopped"""
+        failing = False
+        while True:
+            symbols = self._active_symbols()
+            if not symbols:
+                return
+            
+            with self._refresh_cond:
+                self._refresh_pending = frozenset(symbols)
+            
+            try:
+                snapshot = self._fetch_ltp(symbols)
+                self._snapshot_at = time.monotonic()
+                self._ltp_snapshot = snapshot
+                self._remember_missing(symbols, snapshot, self._snapshot_at)
+                failing = False
+            except Exception as e:
+                if self._stopped.is_set():
+                    return
+                if not failing:
+                    print(f"Error refreshing LTP snapshot: {e}")
+                failing = True
+            finally:
+                with self._refresh_cond:
+                    self._refresh_pending = frozenset()
+                    self._refresh_cond.notify_all()
+            
+            self._stopped.wait(config.Config.LTP_REFRESH_SECONDS)
+    
+    def stop(self):
+        """
+        Stop background work for a client that is being replaced:
+        ends the LTP refresher and closes the async LTP session.
+        """
+        self._stopped.set()
+        
+        with self._subscribe_lock:
+            refresher = self._refresher
+        if refresher is not None:
+            refresher.join(timeout=config.Config.LTP_REFRESH_SECONDS * 2)
+        
+        with self._ltp_session_lock:
+            if self._ltp_session is not None:
+                self._ltp_session.close()
+                self._ltp_session = None
+    
+    def _fetch_ltp(self, symbols: List[str]) -> Dict[str, float]:
+        """Fetch LTP from Kite (raises on API errors)"""
+        # Convert symbols to exchange:symbol format
+        instruments = _decorate_nse(tuple(symbols))
+        
+        # One rate-limit slot per request the batch turns into
+        self._quote_limiter.acquire(-(-len(instruments) // self.CHUNK))
+        
+        # Batches are fetched concurrently over one persistent aiohttp session
+        quotes = self._get_ltp_session().ltp_many(instruments, chunk_size=self.CHUNK)
+        
+        return {instrument[self.PREFIX_LEN:]: data['last_price'] for instrument, data in quotes.items()}
+    
+    def _get_ltp_session(self) -> KiteAsyncSession:
+        """Long-lived async session for LTP, started on first use"""
+        with self._ltp_session_lock:
+            if self._stopped.is_set():
+                raise RuntimeError("KiteClient has been stopped")
+            if self._ltp_session is None:
+                self._ltp_session = KiteAsyncSession(self.kite.api_key, self.kite.access_token, root=self.kite.root)
+            return self._ltp_session
+    
+    def _remember_missing(self, symbols: List[str], prices: Dict[str, float], fetched_at: float):
+        """Record symbols Kite returned no price for, so they aren't re-fetched on every poll"""
+        for symbol in symbols:
+            if symbol not in prices:
+                self._ltp_cache[symbol] = (fetched_at, None)
+    
+    def _cached_prices(self, symbols: List[str]) -> tuple:
+        """
+        Split symbols into known prices and ones that need a fetch.
+        
+        Returns:
+            (ltp_data, stale) - symbols Kite recently had no price for are in neither
+        """
+        now = time.monotonic()
+        ttl = config.Config.LTP_TTL_SECONDS
+        missing_ttl = config.Config.LTP_MISSING_TTL_SECONDS
+        ltp_data = {}
+        stale = []
+        
+        snapshot = self._ltp_snapshot
+        if now - self._snapshot_at > config.Config.LTP_SNAPSHOT_MAX_AGE_SECONDS:
+            snapshot = {}
+        
+        for symbol in symbols:
+            price = snapshot.get(symbol)
+            if price is not None:
+                ltp_data[symbol] = price
+                continue
             
-            data.append({
-                'date': datetime.strptime(from_date, '%Y-%m-%d') + timedelta(minutes=i*15),
-                'open': round(open_price, 2),
-                'high': round(high, 2),
-                'low': round(low, 2),
-                'close': round(close_price, 2),
-                'volume': int(np.random.randint(10000, 100000))
-            })
+            cached = self._ltp_cache.get(symbol)
+            if cached is None:
+                stale.append(symbol)
+            elif cached[1] is None:
+                if now - cached[0] >= missing_ttl:
+                    stale.append(symbol)
+            elif now - cached[0] < ttl:
+                ltp_data[symbol] = cached[1]
+            else:
+                stale.append(symbol)
         
-        return pd.DataFrame(data)
+        return ltp_data, stale
+    
+    def _wait_for_refresh(self, symbols: List[str]) -> bool:
+        """
+        If the refresher is already fetching any of these symbols, wait for it.
+        Returns True if there was such a fetch to wait for.
+        """
+        with self._refresh_cond:
+            pending = self._refresh_pending
+            if pending.isdisjoint(symbols):
+                return False
+            
+            self._refresh_cond.wait_for(
+                lambda: self._refresh_pending is not pending,
+                timeout=config.Config.LTP_SNAPSHOT_MAX_AGE_SECONDS
+            )
+            return True
     
     def get_ltp(self, symbols: List[str]) -> Dict[str, float]:
         """
         Get Last Traded Price for multiple symbols (Execute Day).
         
+        Prices come from the background refresher's snapshot when it is
+        current; anything missing falls back to a direct (TTL-cached) fetch.
+        Symbols Kite has no price for are left out of the result.
+        
         Args:
             symbols: List of trading symbols
         
         Returns:
             Dict mapping symbol to LTP
         """
+        self.subscribe(symbols)
+        
+        # Serve from snapshot or recently fetched prices; only stale symbols hit Kite
+        ltp_data, stale = self._cached_prices(symbols)
+        
+        # A refresher fetch already queued for these symbols beats a second request
+        if stale and self._wait_for_refresh(stale):
+            refreshed, stale = self._cached_prices(stale)
+            ltp_data.update(refreshed)
+        
+        if not stale:
+            return ltp_data
+        
         try:
-            # Convert symbols to exchange:symbol format
-            instruments = [f"NSE:{symbol}" for symbol in symbols]
-            
-            quotes = self.kite.ltp(instruments)
-            
-            ltp_data = {}
-            for instrument, data in quotes.items():
-                symbol = instrument.split(':')[1]
-                ltp_data[symbol] = data['last_price']
+            fetched = self._fetch_ltp(stale)
+            now = time.monotonic()
+            for symbol, price in fetched.items():
+                ltp_data[symbol] = price
+                self._ltp_cache[symbol] = (now, price)
+            self._remember_missing(stale, fetched, now)
             
             return ltp_data
         
         except Exception as e:
             print(f"Error fetching LTP: {e}")
             print("Using mock LTP data")
-            return self._generate_mock_ltp(symbols)
+            ltp_data.update(self._generate_mock_ltp(stale))
+            return ltp_data
     
     def _generate_mock_ltp(self, symbols: List[str]) -> Dict[str, float]:
         """Generate mock LTP for testing"""
-        base_prices = {
-            'HINDZINC': 715.20,
-            'TATASTEEL': 202.32,
-            'RELIANCE': 1391.00,
-            'INFY': 1659.50,
-            'TCS': 3144.40,
-            'HDFCBANK': 935.50,
-            'MRF': 130915.00
-        }
+        bases = np.fromiter(
+            (self.MOCK_BASE_PRICES.get(symbol, 1000) for symbol in symbols),
+            dtype=np.float64,
+            count=len(symbols)
+        )
+        # Add small random variation, drawn for all symbols at once
+        jitters = np.random.default_rng().standard_normal(len(symbols)) * bases * 0.01
+        prices = np.round(bases + jitters, 2)
         
-        ltp_data = {}
-        for symbol in symbols:
-            base = base_prices.get(symbol, 1000)
-            # Add small random variation
-            ltp_data[symbol] = round(base + np.random.randn() * base * 0.01, 2)
-        
-        return ltp_data
+        return dict(zip(symbols, prices.tolist()))
     
     def _get_instrument_token(self, symbol: str) -> int:
         """
-        Map symbol to instrument token.
+        Map symbol to instrument token (0 if unknown).
+        Waits for a background instruments load; raises TimeoutError if it is still running.
         """
-        return self.instruments_cache.get(symbol, 0)
+        if not self._instruments_ready.wait(config.Config.INSTRUMENTS_LOAD_TIMEOUT_SECONDS):
+            raise TimeoutError("Instrument tokens are still loading")
+        return self._tokens.get(symbol, 0)
     
     def get_quote(self, symbols: List[str]) -> Dict[str, Dict]:
         """
         Get detailed quote including OHLC for Execute Day monitoring.
         """
         try:
-            instruments = [f"NSE:{symbol}" for symbol in symbols]
-            quotes = self.kite.quote(instruments)
+            # One request per CHUNK instruments
+            quotes = {}
+            for i in range(0, len(symbols), self.CHUNK):
+                chunk = symbols[i:i + self.CHUNK]
+                quotes.update(self.kite.quote(_decorate_nse(tuple(chunk))))
             
-            quote_data = {}
-            for instrument, data in quotes.items():
-                symbol = instrument.split(':')[1]
-                quote_data[symbol] = {
+            prefix_len = self.PREFIX_LEN
+            return {
+                instrument[prefix_len:]: {
                     'ltp': data['last_price'],
                     'open': data['ohlc']['open'],
                     'high': data['ohlc']['high'],
@@ -183,8 +615,8 @@ class KiteClient:
                     'close': data['ohlc']['close'],
                     'volume': data['volume']
                 }
-            
-            return quote_data
+                for instrument, data in quotes.items()
+            }
         
         except Exception as e:
             print(f"Error fetching quotes: {e}")
@@ -1,26 +1,64 @@
 from flask import Flask, render_template, request, jsonify, redirect, session
-from api.kite_client import KiteClient
+from flask.json.provider import JSONProvider
+from api.kite_client import KiteClient, create_session
 from database.db_manager import DatabaseManager
 from core.fetch_day import FetchDayProcessor
 from core.execute_day import ExecuteDayMonitor
 from kiteconnect import KiteConnect
+from dotenv import set_key, find_dotenv
 import config
 from datetime import datetime
+import logging
 import os
+import orjson
+
+logging.basicConfig(level=config.Config.LOG_LEVEL, format='%(message)s')
+
+class OrjsonProvider(JSONProvider):
+    """
+    JSON provider backed by orjson.
+    Serializes datetime and NumPy values natively, so handlers can return them as-is.
+    """
+    OPTIONS = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+    
+    @staticmethod
+    def _default(obj):
+        # pandas Timestamp and other datetime-likes orjson doesn't know
+        if hasattr(obj, 'isoformat'):
+            return obj.isoformat()
+        raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+    
+    def dumps(self, obj, **kwargs) -> str:
+        return orjson.dumps(obj, default=self._default, option=self.OPTIONS).decode()
+    
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+    
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        body = orjson.dumps(obj, default=self._default, option=self.OPTIONS)
+        return self._app.response_class(body, mimetype='application/json')
 
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 app.secret_key = os.urandom(24)
 
 # Initialize components
 db_manager = DatabaseManager(config.Config.DATABASE_PATH)
 
+# Shared KiteConnect for the OAuth flow (reuses one pooled session)
+kite_auth = KiteConnect(api_key=config.Config.KITE_API_KEY)
+kite_auth.reqsession = create_session()
+
 # Initialize Kite client
 kite_client = None
 try:
     if config.Config.KITE_API_KEY and config.Config.KITE_ACCESS_TOKEN:
+        # Instruments load in the background so startup isn't blocked
         kite_client = KiteClient(
             api_key=config.Config.KITE_API_KEY,
-            access_token=config.Config.KITE_ACCESS_TOKEN
+            access_token=config.Config.KITE_ACCESS_TOKEN,
+            background_load=True
         )
         print("✅ Kite client initialized successfully")
     else:
@@ -46,8 +84,7 @@ def setup():
 @app.route('/login')
 def login():
     """Redirect to Kite login"""
-    kite = KiteConnect(api_key=config.Config.KITE_API_KEY)
-    login_url = kite.login_url()
+    login_url = kite_auth.login_url()
     return redirect(login_url)
 
 @app.route('/callback')
@@ -59,34 +96,29 @@ def callback():
         return "Error: No request token received", 400
     
     try:
-        kite = KiteConnect(api_key=config.Config.KITE_API_KEY)
-        data = kite.generate_session(
+        data = kite_auth.generate_session(
             request_token=request_token,
             api_secret=config.Config.KITE_API_SECRET
         )
         
         access_token = data['access_token']
         
-        # Save to .env file
-        with open('.env', 'r') as f:
-            lines = f.readlines()
-        
-        with open('.env', 'w') as f:
-            for line in lines:
-                if line.startswith('KITE_ACCESS_TOKEN='):
-                    f.write(f'KITE_ACCESS_TOKEN={access_token}\n')
-                else:
-                    f.write(line)
+        # Save to .env file (atomic temp-file swap)
+        set_key(find_dotenv(usecwd=True) or '.env', 'KITE_ACCESS_TOKEN', access_token, quote_mode='never')
         
         # Update config
         config.Config.KITE_ACCESS_TOKEN = access_token
         
-        # Initialize Kite client
+        # Initialize Kite client; the old one's refresher would keep polling with a dead token
         global kite_client
+        previous_client = kite_client
         kite_client = KiteClient(
             api_key=config.Config.KITE_API_KEY,
-            access_token=access_token
+            access_token=access_token,
+            background_load=True
         )
+        if previous_client is not None:
+            previous_client.stop()
         
         return redirect('/')
         
@@ -182,7 +214,7 @@ def execute_day_monitor():
         'data': result['data'],
         'fetch_day': result['fetch_day'],
         'execute_day': result['execute_day'],
-        'timestamp': datetime.now().isoformat()
+        'timestamp': datetime.now()
     })
 
 @app.route('/api/alerts', methods=['GET'])
@@ -217,7 +249,7 @@ def test_fetch_day():
     
     try:
         # Try to fetch data
-        df = kite_client.get_historical_data(
+        candles = kite_client.get_historical_data(
             symbol=symbol,
             from_date=fetch_date,
             to_date=fetch_date,
@@ -228,9 +260,9 @@ def test_fetch_day():
             'success': True,
             'symbol': symbol,
             'fetch_date': fetch_date,
-            'candles_found': len(df),
-            'data_available': not df.empty,
-            'sample': df.head(3).to_dict('records') if not df.empty else []
+            'candles_found': len(candles),
+            'data_available': bool(candles),
+            'sample': candles[:3]
         })
     except Exception as e:
         return jsonify({
@@ -280,20 +312,8 @@ def smart_monitor():
     
     NO manual Fetch Day input. NO future data access.
     """
-    # Initialize kite_client if not already done
-    global kite_client
     if not kite_client:
-        try:
-            kite_client = KiteClient(
-                api_key=config.Config.KITE_API_KEY,
-                access_token=config.Config.KITE_ACCESS_TOKEN
-            )
-            print("✅ Kite client initialized")
-        except Exception as e:
-            return jsonify({
-                'success': False,
-                'error': f'Failed to initialize Kite API: {str(e)}'
-            }), 400
+        return jsonify({'error': 'Kite API not configured'}), 400
     
     from core.date_manager import DateManager
     
@@ -317,20 +337,28 @@ def smart_monitor():
         # Step 2: Process Fetch Day (extract zones if not exists)
         processor = FetchDayProcessor(kite_client, db_manager)
         
-        # Check if zones already exist and generate if needed
+        # Check if zones already exist; generate missing ones in one batch
         zones_generated = False
+        missing_symbols = []
+        zones_by_symbol = db_manager.get_zones_for_symbols(symbols, fetch_day)
         for symbol in symbols:
-            existing_zones = db_manager.get_zones_for_symbol(symbol, fetch_day)
+            existing_zones = zones_by_symbol.get(symbol)
             if not existing_zones:
                 print(f"🔄 Generating zones for {symbol} from Fetch Day {fetch_day}")
-                zones = processor.process_fetch_day(symbol, fetch_day)
-                if zones:
+                missing_symbols.append(symbol)
+            else:
+                print(f"✓ Using existing {len(existing_zones)} zones for {symbol}")
+        
+        if missing_symbols:
+            results = processor.process_multiple_stocks(missing_symbols, fetch_day)
+            for symbol, result in results.items():
+                if result['error']:
+                    print(f"✗ Error generating zones for {symbol}: {result['error']}")
+                elif result['zones_found']:
                     zones_generated = True
-                    print(f"✅ Generated {len(zones)} zones for {symbol}")
+                    print(f"✅ Generated {result['zones_found']} zones for {symbol}")
                 else:
                     print(f"⚠️ No zones detected for {symbol} on {fetch_day}")
-            else:
-                print(f"✓ Using existing {len(existing_zones)} zones for {symbol}")
         
         # Step 3: Add to decode list (for legacy support)
         db_manager.add_decode_list(execute_day, symbols, fetch_day)
@@ -428,21 +456,8 @@ def save_watchlist():
         return jsonify({'error': 'Missing required fields'}), 400
     
     try:
-        import sqlite3
-        conn = sqlite3.connect(config.Config.DATABASE_PATH)
-        cursor = conn.cursor()
-        
-        # Delete if exists
-        cursor.execute('DELETE FROM watchlists WHERE name = ?', (name,))
-        
-        # Insert new watchlist
-        cursor.execute('''
-            INSERT INTO watchlists (name, description, execute_day, fetch_day, symbols)
-            VALUES (?, ?, ?, ?, ?)
-        ''', (name, description, execute_day, fetch_day, ','.join(symbols)))
-        
-        conn.commit()
-        conn.close()
+        # Replaces any existing watchlist of the same name in one transaction
+        db_manager.save_watchlist(name, description, execute_day, fetch_day, symbols)
         
         return jsonify({
             'success': True,
@@ -455,15 +470,7 @@ def save_watchlist():
 def get_watchlists():
     """Get all saved watchlists"""
     try:
-        import sqlite3
-        conn = sqlite3.connect(config.Config.DATABASE_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM watchlists ORDER BY updated_at DESC')
-        watchlists = [dict(row) for row in cursor.fetchall()]
-        
-        conn.close()
+        watchlists = db_manager.get_watchlists()
         
         return jsonify({
             'success': True,
@@ -481,29 +488,18 @@ def load_watchlist():
         return jsonify({'error': 'Missing watchlist name'}), 400
     
     try:
-        import sqlite3
-        conn = sqlite3.connect(config.Config.DATABASE_PATH)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
-        
-        cursor.execute('SELECT * FROM watchlists WHERE name = ?', (name,))
-        watchlist = cursor.fetchone()
-        
-        conn.close()
+        watchlist = db_manager.get_watchlist(name)
         
         if not watchlist:
             return jsonify({'error': 'Watchlist not found'}), 404
         
-        watchlist = dict(watchlist)
-        symbols = watchlist['symbols'].split(',')
-        
         return jsonify({
             'success': True,
             'name': watchlist['name'],
             'description': watchlist['description'],
             'execute_day': watchlist['execute_day'],
             'fetch_day': watchlist['fetch_day'],
-            'symbols': symbols
+            'symbols': watchlist['symbols']
         })
     except Exception as e:
         return jsonify({'error': str(e)}), 500
@@ -518,13 +514,7 @@ def delete_watchlist():
         return jsonify({'error': 'Missing watchlist name'}), 400
     
     try:
-        import sqlite3
-        conn = sqlite3.connect(config.Config.DATABASE_PATH)
-        cursor = conn.cursor()
-        
-        cursor.execute('DELETE FROM watchlists WHERE name = ?', (name,))
-        conn.commit()
-        conn.close()
+        db_manager.delete_watchlist(name)
         
         return jsonify({
             'success': True,
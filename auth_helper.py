@@ -9,6 +9,7 @@ Run this script to generate access token:
 """
 
 from kiteconnect import KiteConnect
+from dotenv import set_key, find_dotenv
 import config
 from urllib.parse import urlparse, parse_qs
 
@@ -51,16 +52,8 @@ def generate_access_token(kite, request_token):
     return access_token
 
 def save_access_token(access_token):
-    """Save access token to .env file"""
-    with open('.env', 'r') as f:
-        lines = f.readlines()
-    
-    with open('.env', 'w') as f:
-        for line in lines:
-            if line.startswith('KITE_ACCESS_TOKEN='):
-                f.write(f'KITE_ACCESS_TOKEN={access_token}\n')
-            else:
-                f.write(line)
+    """Save access token to .env file (atomic temp-file swap)"""
+    set_key(find_dotenv(usecwd=True) or '.env', 'KITE_ACCESS_TOKEN', access_token, quote_mode='never')
     
     print("\n✓ Access token saved to .env file")
     print(f"✓ Token: {access_token[:20]}...")
@@ -10,9 +10,17 @@ class Config:
     KITE_ACCESS_TOKEN = os.getenv('KITE_ACCESS_TOKEN', '')
     KITE_REDIRECT_URL = os.getenv('KITE_REDIRECT_URL', 'http://localhost:8080/callback')
     
+    # Logging (DEBUG adds per-zone and candle-count lines)
+    LOG_LEVEL = os.getenv('LOG_LEVEL', 'INFO')
+    
     # Database
     DATABASE_PATH = 'trading_zones.db'
     
+    # Instrument token cache (one file per trading day)
+    INSTRUMENTS_CACHE_DIR = 'cache'
+    INSTRUMENTS_CACHE_TTL_SECONDS = 12 * 60 * 60  # 12 hours
+    INSTRUMENTS_LOAD_TIMEOUT_SECONDS = 30  # Max wait for a background load before giving up on a fetch
+    
     # Zone detection parameters
     TIMEFRAME = '15minute'  # 5minute, 10minute, 15minute
     ATR_MULTIPLIER = 1.5  # Minimum impulse move threshold
@@ -24,3 +32,20 @@ class Config:
     
     # UI refresh rate
     REFRESH_INTERVAL_MS = 3000  # 3 seconds
+    
+    # Kite historical API limits (historical_data allows ~3 requests/second)
+    HISTORICAL_REQUESTS_PER_SECOND = 3
+    HISTORICAL_RETRIES = 3  # Retries for 429 / network errors
+    HISTORICAL_RETRY_BACKOFF_SECONDS = 0.5  # Doubled on each retry
+    
+    # LTP cache lifetime (absorbs overlapping dashboard polls)
+    LTP_TTL_SECONDS = 0.8
+    LTP_MISSING_TTL_SECONDS = 60.0  # Don't re-ask Kite for symbols it had no price for (delisted / typos)
+    
+    # Kite quote API limit (shared by the refresher and direct LTP fetches)
+    QUOTE_REQUESTS_PER_SECOND = 1
+    
+    # Background LTP refresher
+    LTP_REFRESH_SECONDS = 2.0  # Poll cadence for subscribed symbols (leaves headroom under the quote limit)
+    LTP_SUBSCRIPTION_IDLE_SECONDS = 30.0  # Stop refreshing symbols nobody has asked for since
+    LTP_SNAPSHOT_MAX_AGE_SECONDS = 3.0  # Ignore the snapshot if the refresher stalls
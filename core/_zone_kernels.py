@@ -0,0 +1,111 @@
+"""
+Zone detection kernels.
+Plain Python source shared by both compile paths: ZoneDetector JITs these with
+numba, or uses the ahead-of-time build when it is present.
+
+Build the AOT module (writes core/zone_kernels*.so next to this file):
+    python -m core._zone_kernels
+"""
+
+import os
+import numpy as np
+
+def scan_impulse(high: np.ndarray, low: np.ndarray, close: np.ndarray, atr: float, atr_mult: float) -> tuple:
+    """
+    Impulse scan over raw OHLC arrays.
+    
+    Returns:
+        (start_idx, end_idx, net_move, bullish) - start_idx is -1 if no impulse
+    """
+    n = close.shape[0]
+    threshold = atr_mult * atr
+    best_start = -1
+    best_end = -1
+    best_bullish = False
+    max_move = 0.0
+    
+    for i in range(n - 3):
+        price_start = close[i]
+        
+        # Running extremes over [i, j]; seed with the first three candles
+        lowest = min(low[i], low[i + 1], low[i + 2])
+        highest = max(high[i], high[i + 1], high[i + 2])
+        
+        for j in range(i + 3, min(i + 20, n)):
+            lowest = min(lowest, low[j])
+            highest = max(highest, high[j])
+            
+            price_end = close[j]
+            net_move = abs(price_end - price_start)
+            
+            # Check if move is significant
+            if net_move < threshold:
+                continue
+            
+            # Check directional dominance (minimal pullback)
+            bullish = price_end > price_start
+            if bullish:
+                pullback = price_start - lowest
+            else:
+                pullback = highest - price_start
+            if pullback > net_move * 0.3:
+                continue
+            
+            # Track best impulse
+            if net_move > max_move:
+                max_move = net_move
+                best_start = i
+                best_end = j
+                best_bullish = bullish
+    
+    return best_start, best_end, max_move, best_bullish
+
+def find_origin_zone(high: np.ndarray, low: np.ndarray, close: np.ndarray,
+                     impulse_start_idx: int, candles_min: int, candles_max: int) -> tuple:
+    """
+    Balanced-range search backwards from the impulse start.
+    
+    Returns:
+        (zone_low, zone_high, candle_count) - candle_count is -1 if no zone
+    """
+    zone_end = impulse_start_idx
+    max_lookback = min(candles_max, impulse_start_idx)
+    
+    # Grow the window one candle further back per step, carrying the running
+    # extremes and range sum instead of rescanning every lookback
+    zone_low = low[zone_end - 1]
+    zone_high = high[zone_end - 1]
+    range_sum = 0.0
+    
+    for lookback in range(1, max_lookback + 1):
+        zone_start = zone_end - lookback
+        zone_low = min(zone_low, low[zone_start])
+        zone_high = max(zone_high, high[zone_start])
+        range_sum += high[zone_start] - low[zone_start]
+        
+        if lookback < candles_min:
+            continue
+        
+        zone_range = zone_high - zone_low
+        avg_candle_range = range_sum / lookback
+        
+        # Compressed, with minimal directional progress
+        if zone_range < avg_candle_range * 2.5:
+            net_progress = abs(close[zone_end - 1] - close[zone_start])
+            if net_progress < zone_range * 0.5:
+                return zone_low, zone_high, lookback
+    
+    return 0.0, 0.0, -1
+
+def build(output_dir: str = None):
+    """Compile the kernels ahead of time into the zone_kernels extension module"""
+    from numba.pycc import CC
+    
+    cc = CC('zone_kernels')
+    cc.output_dir = output_dir or os.path.dirname(os.path.abspath(__file__))
+    cc.export('scan_impulse', 'Tuple((i8, i8, f8, b1))(f8[:], f8[:], f8[:], f8, f8)')(scan_impulse)
+    cc.export('find_origin_zone', 'Tuple((f8, f8, i8))(f8[:], f8[:], f8[:], i8, i8, i8)')(find_origin_zone)
+    cc.compile()
+
+if __name__ == '__main__':
+    build()
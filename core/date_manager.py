@@ -4,7 +4,28 @@ CRITICAL: Execute Day → Fetch Day (auto-calculated, historical only)
 """
 
 from datetime import datetime, timedelta
-from typing import Optional, List
+from functools import lru_cache
+from typing import Optional, List, Dict, Tuple
+import calendar
+import numpy as np
+
+@lru_cache(maxsize=None)
+def _weekend_mask(year: int, month: int) -> int:
+    """Bit d set for every Saturday/Sunday d of the month (bit 0 unused)"""
+    first_weekday, num_days = calendar.monthrange(year, month)
+    mask = 0
+    for day in range(1, num_days + 1):
+        if (first_weekday + day - 1) % 7 >= 5:
+            mask |= 1 << day
+    return mask
+
+def _build_holiday_masks(holidays: List[str]) -> Dict[Tuple[int, int], int]:
+    """Per-(year, month) bitmask of non-trading days: weekends plus holidays"""
+    masks = {}
+    for holiday in holidays:
+        year, month, day = (int(part) for part in holiday.split('-'))
+        masks[(year, month)] = masks.get((year, month), _weekend_mask(year, month)) | (1 << day)
+    return masks
 
 class DateManager:
     """
@@ -35,22 +56,29 @@ class DateManager:
         '2026-12-25',  # Christmas
     ]
     
+    # Bit d of _HOLIDAY_MASK[(year, month)] set = day d is not a trading day
+    _HOLIDAY_MASK = _build_holiday_masks(NSE_HOLIDAYS_2026)
+    
+    # Mon-Fri business-day calendar for vectorized date arithmetic
+    _HOLIDAYS_NP = np.array(NSE_HOLIDAYS_2026, dtype='datetime64[D]')
+    _BUSDAY_CAL = np.busdaycalendar(holidays=_HOLIDAYS_NP)
+    
+    @staticmethod
+    def _month_mask(year: int, month: int) -> int:
+        """Non-trading-day bitmask for a month (weekends only if no holidays listed)"""
+        mask = DateManager._HOLIDAY_MASK.get((year, month))
+        if mask is None:
+            mask = _weekend_mask(year, month)
+        return mask
+    
     @staticmethod
     def is_trading_day(date: datetime) -> bool:
         """
         Check if a date is a trading day.
         Returns False for weekends and NSE holidays.
         """
-        # Check weekend
-        if date.weekday() >= 5:  # Saturday = 5, Sunday = 6
-            return False
-        
-        # Check NSE holidays
-        date_str = date.strftime('%Y-%m-%d')
-        if date_str in DateManager.NSE_HOLIDAYS_2026:
-            return False
-        
-        return True
+        mask = DateManager._month_mask(date.year, date.month)
+        return ((mask >> date.day) & 1) == 0
     
     @staticmethod
     def get_previous_trading_day(date: datetime) -> datetime:
@@ -58,17 +86,17 @@ class DateManager:
         Get the previous trading day from given date.
         Skips weekends and holidays.
         """
-        current = date - timedelta(days=1)
+        # Trading days earlier in this month: clear bits in 1..day-1
+        open_days = ~DateManager._month_mask(date.year, date.month) & ((1 << date.day) - 2)
+        current = date
         
-        # Keep going back until we find a trading day
-        max_lookback = 10  # Safety limit
-        for _ in range(max_lookback):
-            if DateManager.is_trading_day(current):
-                return current
-            current = current - timedelta(days=1)
+        # Whole month closed before this date: move to the end of the previous month
+        while not open_days:
+            current = current.replace(day=1) - timedelta(days=1)
+            open_days = ~DateManager._month_mask(current.year, current.month) & ((1 << (current.day + 1)) - 2)
         
-        # Fallback: return 1 day back (shouldn't happen)
-        return date - timedelta(days=1)
+        # Highest clear bit is the latest trading day
+        return current.replace(day=open_days.bit_length() - 1)
     
     @staticmethod
     def calculate_fetch_day(execute_day: str) -> str:
@@ -89,17 +117,17 @@ class DateManager:
             → Go back 2 trading days → 2026-01-28 (Wednesday)
             Fetch Day = 2026-01-28
         """
-        execute_dt = datetime.strptime(execute_day, '%Y-%m-%d')
-        
-        # Go back 2 trading days
-        current = execute_dt
-        trading_days_back = 0
-        
-        while trading_days_back < 2:
-            current = DateManager.get_previous_trading_day(current)
-            trading_days_back += 1
-        
-        return current.strftime('%Y-%m-%d')
+        return str(DateManager._fetch_date64(execute_day))
+    
+    @staticmethod
+    def _fetch_date64(execute_day) -> np.datetime64:
+        """Fetch Day as datetime64[D] for anything np.datetime64 accepts (str, date, datetime)"""
+        # roll='forward' first moves a non-trading Execute Day to the next
+        # session, so -2 lands on the same day as stepping back twice from it
+        return np.busday_offset(
+            np.datetime64(execute_day, 'D'), -2,
+            roll='forward', busdaycal=DateManager._BUSDAY_CAL
+        )
     
     @staticmethod
     def get_trading_days_between(start_date: str, end_date: str) -> List[str]:
@@ -107,18 +135,25 @@ class DateManager:
         Get all trading days between two dates (inclusive).
         Useful for historical replay.
         """
-        start_dt = datetime.strptime(start_date, '%Y-%m-%d')
-        end_dt = datetime.strptime(end_date, '%Y-%m-%d')
-        
-        trading_days = []
-        current = start_dt
-        
-        while current <= end_dt:
-            if DateManager.is_trading_day(current):
-                trading_days.append(current.strftime('%Y-%m-%d'))
-            current += timedelta(days=1)
+        dates = np.arange(np.datetime64(start_date, 'D'), np.datetime64(end_date, 'D') + 1)
+        trading = np.is_busday(dates, busdaycal=DateManager._BUSDAY_CAL)
+        return dates[trading].astype(str).tolist()
+    
+    @staticmethod
+    def parse_date(date_str: str) -> datetime:
+        """
+        Parse a 'YYYY-MM-DD' string (same inputs and errors as strptime).
+        fromisoformat is the fast path, but it also takes '20260130' or
+        '2026-01-30T10:00', so its result only counts if it round-trips.
+        """
+        try:
+            parsed = datetime.fromisoformat(date_str)
+            if parsed.date().isoformat() == date_str:
+                return parsed
+        except ValueError:
+            pass
         
-        return trading_days
+        return datetime.strptime(date_str, '%Y-%m-%d')
     
     @staticmethod
     def validate_execute_day(execute_day: str) -> tuple:
@@ -129,19 +164,29 @@ class DateManager:
             (is_valid, fetch_day, error_message)
         """
         try:
-            execute_dt = datetime.strptime(execute_day, '%Y-%m-%d')
-            
-            # Calculate Fetch Day
-            fetch_day = DateManager.calculate_fetch_day(execute_day)
-            
-            # Fetch Day must be in the past (historical data only)
-            fetch_dt = datetime.strptime(fetch_day, '%Y-%m-%d')
+            execute_dt = DateManager.parse_date(execute_day)
             today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
             
-            if fetch_dt > today:
-                return (False, None, f"Fetch Day ({fetch_day}) is in the future. No historical data available.")
-            
-            return (True, fetch_day, None)
+            return DateManager.validate_execute_day_dt(execute_dt, today)
             
         except ValueError as e:
             return (False, None, f"Invalid date format: {str(e)}")
+    
+    @staticmethod
+    def validate_execute_day_dt(execute_dt: datetime, today: datetime) -> tuple:
+        """
+        validate_execute_day for an already-parsed Execute Day.
+        Lets callers that also need the datetime (and today) compute them once.
+        
+        Returns:
+            (is_valid, fetch_day, error_message)
+        """
+        # Calculate Fetch Day
+        fetch_date = DateManager._fetch_date64(execute_dt.date())
+        fetch_day = str(fetch_date)
+        
+        # Fetch Day must be in the past (historical data only)
+        if fetch_date > np.datetime64(today.date(), 'D'):
+            return (False, None, f"Fetch Day ({fetch_day}) is in the future. No historical data available.")
+        
+        return (True, fetch_day, None)
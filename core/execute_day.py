@@ -2,8 +2,47 @@ from api.kite_client import KiteClient
 from database.db_manager import DatabaseManager
 from core.date_manager import DateManager
 from typing import List, Dict, Optional
+from datetime import datetime
+from numba import njit, prange
+import numpy as np
 import config
 
+# Zone status codes produced by check_proximity
+PROXIMITY_FAR = 0
+PROXIMITY_NEAR = 1
+PROXIMITY_INSIDE = 2
+
+@njit(cache=True, parallel=True)
+def check_proximity(ltps: np.ndarray, zone_lows: np.ndarray, zone_highs: np.ndarray,
+                    zone_mids: np.ndarray, pct: float) -> tuple:
+    """
+    Classify every zone against the LTP of its symbol in one compiled pass.
+    
+    Args:
+        ltps: LTP of the owning symbol, one entry per zone
+        zone_lows: Zone lower bounds
+        zone_highs: Zone upper bounds
+        zone_mids: Zone midpoints (stored with the zone)
+        pct: Near threshold, compared against distance in percent
+    
+    Returns:
+        (codes, distances): PROXIMITY_* code per zone and signed % distance from zone mid
+    """
+    n = zone_lows.shape[0]
+    codes = np.zeros(n, dtype=np.int8)
+    distances = np.empty(n, dtype=np.float64)
+    
+    for k in prange(n):
+        distance = ((ltps[k] - zone_mids[k]) / zone_mids[k]) * 100
+        distances[k] = distance
+        
+        if zone_lows[k] <= ltps[k] <= zone_highs[k]:
+            codes[k] = PROXIMITY_INSIDE
+        elif abs(distance) <= pct:
+            codes[k] = PROXIMITY_NEAR
+    
+    return codes, distances
+
 class ExecuteDayMonitor:
     """
     Execute Day: Monitor live prices against Fetch Day zones.
@@ -34,7 +73,18 @@ class ExecuteDayMonitor:
             Dict with: success, data, fetch_day, execute_day, error
         """
         # Step 1: Validate Execute Day and calculate Fetch Day
-        is_valid, fetch_day, error = DateManager.validate_execute_day(execute_day)
+        # Parse once; the same datetimes drive validation and the live/replay choice
+        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        try:
+            execute_dt = DateManager.parse_date(execute_day)
+        except ValueError as e:
+            return {
+                'success': False,
+                'error': f"Invalid date format: {str(e)}",
+                'data': []
+            }
+        
+        is_valid, fetch_day, error = DateManager.validate_execute_day_dt(execute_dt, today)
         
         if not is_valid:
             return {
@@ -46,54 +96,65 @@ class ExecuteDayMonitor:
         # Step 2: Ensure zones exist for Fetch Day
         # Generate zones on-demand if missing
         zones_generated = False
-        for symbol in symbols:
-            existing_zones = self.db.get_zones_for_symbol(symbol, fetch_day)
-            if not existing_zones:
-                # Need to generate zones
-                from core.fetch_day import FetchDayProcessor
-                processor = FetchDayProcessor(self.kite, self.db)
-                
-                try:
-                    zones = processor.process_fetch_day(symbol, fetch_day)
-                    if zones:
+        zones_by_symbol = self.db.get_zones_for_symbols(symbols, fetch_day)
+        missing_symbols = [symbol for symbol in symbols if not zones_by_symbol.get(symbol)]
+        
+        if missing_symbols:
+            # Need to generate zones - candles for all missing symbols are fetched in parallel
+            from core.fetch_day import FetchDayProcessor
+            processor = FetchDayProcessor(self.kite, self.db)
+            
+            try:
+                results = processor.process_multiple_stocks(missing_symbols, fetch_day)
+                for symbol, result in results.items():
+                    if result['error']:
+                        print(f"✗ Error generating zones for {symbol}: {result['error']}")
+                    elif result['zones_found']:
                         zones_generated = True
-                        print(f"✓ Generated {len(zones)} zones for {symbol} from {fetch_day}")
+                        print(f"✓ Generated {result['zones_found']} zones for {symbol} from {fetch_day}")
                     else:
                         print(f"⚠ No zones found for {symbol} on {fetch_day}")
-                except Exception as e:
-                    print(f"✗ Error generating zones for {symbol}: {e}")
+            except Exception as e:
+                print(f"✗ Error generating zones for {', '.join(missing_symbols)}: {e}")
+            
+            # Re-read only the symbols that were just processed
+            zones_by_symbol.update(self.db.get_zones_for_symbols(missing_symbols, fetch_day))
         
         # Step 3: Get prices for Execute Day
         # If Execute Day is today → use LTP
         # If Execute Day is historical → use historical close price
-        from datetime import datetime
-        execute_dt = datetime.strptime(execute_day, '%Y-%m-%d')
-        today = datetime.now().replace(hour=0, minute=0, second=0, microsecond=0)
+        is_live = execute_dt.date() == today.date()
         
-        if execute_dt.date() == today.date():
+        if is_live:
             # Live monitoring - use LTP
             price_data = self.kite.get_ltp(symbols)
         else:
             # Historical replay - use close price from Execute Day
             price_data = self._get_historical_prices(symbols, execute_day)
         
-        # Step 4: Build monitoring data
-        monitoring_data = []
+        # Step 4: Pair every priced symbol with its Fetch Day zones
+        rows = [
+            (symbol, price_data[symbol], zones_by_symbol.get(symbol, []))
+            for symbol in symbols
+            if price_data.get(symbol, 0) != 0
+        ]
         
-        for symbol in symbols:
-            # Get zones from Fetch Day
-            zones = self.db.get_zones_for_symbol(symbol, fetch_day)
-            
-            # Get price
-            ltp = price_data.get(symbol, 0)
-            
-            if ltp == 0:
-                continue
-            
-            # Calculate proximity to zones
-            status, closest_zone, distance_pct, reaction = self._calculate_proximity(ltp, zones)
-            
-            monitoring_data.append({
+        # Step 5: Classify all zones against their LTPs in one pass
+        counts = [len(zones) for _, _, zones in rows]
+        ltps = np.repeat(np.array([ltp for _, ltp, _ in rows], dtype=np.float64), counts)
+        zone_lows = np.array([zone['zone_low'] for _, _, zones in rows for zone in zones], dtype=np.float64)
+        zone_highs = np.array([zone['zone_high'] for _, _, zones in rows for zone in zones], dtype=np.float64)
+        zone_mids = np.array([zone['zone_mid'] for _, _, zones in rows for zone in zones], dtype=np.float64)
+        codes, distances = check_proximity(ltps, zone_lows, zone_highs, zone_mids, self.near_threshold)
+        
+        bounds = np.concatenate(([0], np.cumsum(counts, dtype=np.int64)))
+        proximity = [
+            self._calculate_proximity(zones, codes[start:end], distances[start:end])
+            for (_, _, zones), start, end in zip(rows, bounds[:-1], bounds[1:])
+        ]
+        
+        monitoring_data = [
+            {
                 'symbol': symbol,
                 'ltp': float(ltp),
                 'zones': zones,
@@ -103,7 +164,9 @@ class ExecuteDayMonitor:
                 'reaction': reaction,
                 'fetch_date': fetch_day,
                 'execute_date': execute_day
-            })
+            }
+            for (symbol, ltp, zones), (status, closest_zone, distance_pct, reaction) in zip(rows, proximity)
+        ]
         
         return {
             'success': True,
@@ -120,26 +183,35 @@ class ExecuteDayMonitor:
         """
         prices = {}
         
-        for symbol in symbols:
-            try:
-                df = self.kite.get_historical_data(
-                    symbol=symbol,
-                    from_date=date,
-                    to_date=date,
-                    interval='day'
-                )
-                
-                if not df.empty:
-                    prices[symbol] = df.iloc[-1]['close']
-            except Exception as e:
-                print(f"Error fetching historical price for {symbol}: {e}")
+        try:
+            # One daily candle per symbol, fetched concurrently; symbols without
+            # real data are left out rather than priced from mock candles
+            candles_by_symbol = self.kite.get_historical_data_batch(
+                symbols=symbols,
+                from_date=date,
+                to_date=date,
+                interval='day',
+                allow_mock=False
+            )
+        except Exception as e:
+            print(f"Error fetching historical prices: {e}")
+            return prices
+        
+        for symbol, candles in candles_by_symbol.items():
+            if candles:
+                prices[symbol] = candles[-1]['close']
         
         return prices
     
-    def _calculate_proximity(self, ltp: float, zones: List[Dict]) -> tuple:
+    def _calculate_proximity(self, zones: List[Dict], codes: np.ndarray, distances: np.ndarray) -> tuple:
         """
         Calculate price proximity to zones with proper distance calculation.
         
+        Args:
+            zones: Zones for one symbol
+            codes: check_proximity codes for those zones
+            distances: check_proximity % distances for those zones
+        
         Returns:
             (status, closest_zone, distance_percent, reaction_state)
             
@@ -159,50 +231,37 @@ class ExecuteDayMonitor:
         if not zones:
             return ('FAR', None, 100.0, 'No Touch Yet')
         
-        closest_zone = None
-        min_distance_pct = float('inf')
-        status = 'FAR'
-        reaction = 'No Touch Yet'
-        
-        for zone in zones:
-            zone_low = zone['zone_low']
-            zone_high = zone['zone_high']
-            zone_mid = (zone_low + zone_high) / 2
-            
-            # Calculate distance as percentage from zone mid
-            distance_from_mid = ((ltp - zone_mid) / zone_mid) * 100
+        # First zone containing the price wins
+        inside = np.flatnonzero(codes == PROXIMITY_INSIDE)
+        if inside.size:
+            idx = inside[0]
+            zone = zones[idx]
+            if zone['zone_type'] == 'BULLISH':
+                status = 'INSIDE_BULLISH'
+            else:
+                status = 'INSIDE_BEARISH'
             
-            # Check if inside zone
-            if zone_low <= ltp <= zone_high:
-                if zone['zone_type'] == 'BULLISH':
-                    status = 'INSIDE_BULLISH'
-                else:
-                    status = 'INSIDE_BEARISH'
-                
-                # Determine reaction state (simplified - can be enhanced with historical data)
-                reaction = 'Holding'  # Default for inside zone
-                
-                return (status, zone, distance_from_mid, reaction)
+            # Determine reaction state (simplified - can be enhanced with historical data)
+            reaction = 'Holding'  # Default for inside zone
             
-            # Calculate absolute distance percentage
-            abs_distance_pct = abs(distance_from_mid)
-            
-            if abs_distance_pct < abs(min_distance_pct):
-                min_distance_pct = distance_from_mid
-                closest_zone = zone
-                
-                # Determine status based on distance
-                if abs_distance_pct <= self.near_threshold:
-                    status = 'NEAR'
-                    reaction = 'First Touch'  # Approaching zone
-                elif abs_distance_pct > self.far_threshold:
-                    status = 'FAR'
-                    reaction = 'No Touch Yet'
-                else:
-                    status = 'NEAR'
-                    reaction = 'No Touch Yet'
-        
-        return (status, closest_zone, min_distance_pct, reaction)
+            return (status, zone, distances[idx], reaction)
+        
+        # Otherwise report the closest zone
+        idx = int(np.argmin(np.abs(distances)))
+        abs_distance_pct = abs(distances[idx])
+        
+        # Determine status based on distance
+        if codes[idx] == PROXIMITY_NEAR:
+            status = 'NEAR'
+            reaction = 'First Touch'  # Approaching zone
+        elif abs_distance_pct > self.far_threshold:
+            status = 'FAR'
+            reaction = 'No Touch Yet'
+        else:
+            status = 'NEAR'
+            reaction = 'No Touch Yet'
+        
+        return (status, zones[idx], distances[idx], reaction)
     
     def get_alerts(self, monitoring_data: List[Dict]) -> List[Dict]:
         """
@@ -2,8 +2,12 @@ from api.kite_client import KiteClient
 from core.zone_detector import ZoneDetector
 from database.db_manager import DatabaseManager
 from typing import List
+import logging
+import pandas as pd
 import config
 
+logger = logging.getLogger(__name__)
+
 class FetchDayProcessor:
     """
     Processes Fetch Day: extracts zones and stores them immutably.
@@ -34,51 +38,84 @@ class FetchDayProcessor:
         if timeframe is None:
             timeframe = config.Config.TIMEFRAME
         
-        print(f"📊 Processing Fetch Day for {symbol} on {fetch_date}...")
+        logger.info("📊 Processing Fetch Day for %s on %s...", symbol, fetch_date)
         
         # Fetch historical data for the entire Fetch Day
         df = self.kite.get_historical_data(
             symbol=symbol,
             from_date=fetch_date,
             to_date=fetch_date,
-            interval=timeframe
+            interval=timeframe,
+            as_dataframe=True
         )
         
+        return self._extract_and_save(df, symbol, fetch_date, timeframe)
+    
+    def _extract_and_save(self, df: pd.DataFrame, symbol: str, fetch_date: str, timeframe: str) -> List[dict]:
+        """Extract zones from already-fetched Fetch Day candles and store them."""
         if df.empty:
-            print(f"⚠ No data available for {symbol} on {fetch_date}")
+            logger.warning("⚠ No data available for %s on %s", symbol, fetch_date)
             return []
         
-        print(f"✓ Loaded {len(df)} candles for {symbol}")
+        logger.debug("✓ Loaded %d candles for %s", len(df), symbol)
         
         # Extract zones using zone detector
         zones = self.detector.extract_zones(df, symbol, fetch_date, timeframe)
         
         if not zones:
-            print(f"⚠ No valid zones detected for {symbol}")
+            logger.info("⚠ No valid zones detected for %s", symbol)
             return []
         
-        # Save zones to database (immutable)
-        for zone in zones:
-            success = self.db.save_zone(zone)
-            if success:
-                print(f"✓ Saved {zone['zone_type']} zone: {zone['zone_low']:.2f} - {zone['zone_high']:.2f}")
-            else:
-                print(f"⚠ Zone already exists or failed to save")
+        # Zones from mock candles are shown but never stored as Fetch Day zones
+        if df.attrs.get('mock'):
+            logger.warning("⚠ %s candles are mock data; zones not saved", symbol)
+            return zones
+        
+        # Save zones to database (immutable) in one transaction
+        saved = self.db.save_zones_bulk(zones)
+        if logger.isEnabledFor(logging.DEBUG):
+            for zone in zones:
+                logger.debug("✓ %s zone: %.2f - %.2f", zone['zone_type'], zone['zone_low'], zone['zone_high'])
+        if saved < len(zones):
+            logger.warning("⚠ %d zone(s) already existed or failed to save", len(zones) - saved)
         
         return zones
     
     def process_multiple_stocks(self, symbols: List[str], fetch_date: str) -> dict:
         """
         Process multiple stocks for the same Fetch Day.
-        Returns summary of zones found per stock.
+        Returns summary of zones found per stock; a failing stock is recorded
+        with its error and does not stop the others.
         """
+        timeframe = config.Config.TIMEFRAME
         results = {}
         
+        # Fire all historical data requests in parallel, then extract serially
+        candles = self.kite.get_historical_data_batch(
+            symbols=symbols,
+            from_date=fetch_date,
+            to_date=fetch_date,
+            interval=timeframe,
+            as_dataframe=True
+        )
+        
         for symbol in symbols:
-            zones = self.process_fetch_day(symbol, fetch_date)
+            logger.info("📊 Processing Fetch Day for %s on %s...", symbol, fetch_date)
+            try:
+                zones = self._extract_and_save(candles[symbol], symbol, fetch_date, timeframe)
+            except Exception as e:
+                logger.error("✗ Error processing Fetch Day for %s: %s", symbol, e)
+                results[symbol] = {
+                    'zones_found': 0,
+                    'zones': [],
+                    'error': str(e)
+                }
+                continue
+            
             results[symbol] = {
                 'zones_found': len(zones),
-                'zones': zones
+                'zones': zones,
+                'error': None
             }
         
         return results
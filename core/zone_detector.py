@@ -1,6 +1,16 @@
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Optional, Tuple
+from numba import njit
+from typing import List, Dict, Optional
+from core import _zone_kernels
+
+# Prefer the ahead-of-time build (python -m core._zone_kernels) so the first
+# Fetch Day doesn't pay for JIT compilation; otherwise JIT the same source
+try:
+    from core.zone_kernels import scan_impulse as _scan_impulse, find_origin_zone as _find_origin_zone
+except ImportError:
+    _scan_impulse = njit(cache=True)(_zone_kernels.scan_impulse)
+    _find_origin_zone = njit(cache=True)(_zone_kernels.find_origin_zone)
 
 class ZoneDetector:
     """
@@ -15,66 +25,49 @@ class ZoneDetector:
     
     def calculate_atr(self, df: pd.DataFrame, period: int = 14) -> float:
         """Calculate Average True Range"""
-        high_low = df['high'] - df['low']
-        high_close = np.abs(df['high'] - df['close'].shift())
-        low_close = np.abs(df['low'] - df['close'].shift())
+        high = df['high'].to_numpy(np.float64)
+        low = df['low'].to_numpy(np.float64)
+        prev_close = np.concatenate(([np.nan], df['close'].to_numpy(np.float64)[:-1]))
         
-        ranges = pd.concat([high_low, high_close, low_close], axis=1)
-        true_range = ranges.max(axis=1)
-        atr = true_range.rolling(period).mean().iloc[-1]
+        # fmax skips the NaN previous close on the first candle, like max(axis=1)
+        true_range = np.fmax.reduce([high - low, np.abs(high - prev_close), np.abs(low - prev_close)])
+        atr = true_range[-period:].mean() if len(true_range) >= period else np.nan
         
         return atr if not np.isnan(atr) else df['high'].mean() - df['low'].mean()
     
-    def find_major_impulse(self, df: pd.DataFrame, atr: float) -> Optional[Dict]:
+    @staticmethod
+    def _to_arrays(df: pd.DataFrame) -> Dict:
+        """
+        Positional column views taken once per Fetch Day.
+        h/l/c are contiguous float64 for the compiled kernels; d keeps pandas
+        Timestamps so impulse times are stored in the same format as before.
+        """
+        return {
+            'h': np.ascontiguousarray(df['high'].to_numpy(np.float64)),
+            'l': np.ascontiguousarray(df['low'].to_numpy(np.float64)),
+            'c': np.ascontiguousarray(df['close'].to_numpy(np.float64)),
+            'd': df['date'].array
+        }
+    
+    def find_major_impulse(self, arrs: Dict, atr: float) -> Optional[Dict]:
         """
         Identify the largest directional move of Fetch Day.
         Returns: {direction, start_idx, end_idx, strength}
         """
-        df = df.reset_index(drop=True)
-        best_impulse = None
-        max_move = 0
-        
-        # Scan for impulse moves
-        for i in range(len(df) - 3):
-            for j in range(i + 3, min(i + 20, len(df))):
-                # Calculate net directional move
-                price_start = df.loc[i, 'close']
-                price_end = df.loc[j, 'close']
-                net_move = abs(price_end - price_start)
-                
-                # Check if move is significant
-                if net_move < self.atr_multiplier * atr:
-                    continue
-                
-                # Check directional dominance (minimal pullback)
-                if price_end > price_start:  # Bullish
-                    lowest_in_range = df.loc[i:j, 'low'].min()
-                    pullback = price_start - lowest_in_range
-                    if pullback > net_move * 0.3:  # Too much pullback
-                        continue
-                    direction = 'BULLISH'
-                else:  # Bearish
-                    highest_in_range = df.loc[i:j, 'high'].max()
-                    pullback = highest_in_range - price_start
-                    if pullback > net_move * 0.3:
-                        continue
-                    direction = 'BEARISH'
-                
-                # Track best impulse
-                if net_move > max_move:
-                    max_move = net_move
-                    best_impulse = {
-                        'direction': direction,
-                        'start_idx': i,
-                        'end_idx': j,
-                        'strength': 'HIGH' if net_move > 2 * atr else 'MEDIUM',
-                        'start_time': df.loc[i, 'date'],
-                        'end_time': df.loc[j, 'date']
-                    }
-        
-        return best_impulse
+        i, j, net_move, bullish = _scan_impulse(arrs['h'], arrs['l'], arrs['c'], atr, self.atr_multiplier)
+        if i < 0:
+            return None
+        
+        return {
+            'direction': 'BULLISH' if bullish else 'BEARISH',
+            'start_idx': i,
+            'end_idx': j,
+            'strength': 'HIGH' if net_move > 2 * atr else 'MEDIUM',
+            'start_time': arrs['d'][i],
+            'end_time': arrs['d'][j]
+        }
     
-    def find_origin_zone(self, df: pd.DataFrame, impulse_start_idx: int) -> Optional[Dict]:
+    def find_origin_zone(self, arrs: Dict, impulse_start_idx: int) -> Optional[Dict]:
         """
         Look backwards from impulse start to find the last balanced range.
         Balanced = overlapping candles, compression, no directional progress.
@@ -82,47 +75,30 @@ class ZoneDetector:
         if impulse_start_idx < self.zone_candles_min:
             return None
         
-        # Look back from impulse start
-        for lookback in range(self.zone_candles_min, min(self.zone_candles_max + 1, impulse_start_idx + 1)):
-            zone_start = impulse_start_idx - lookback
-            zone_end = impulse_start_idx
-            
-            zone_candles = df.iloc[zone_start:zone_end]
-            
-            # Check for compression (overlapping ranges)
-            zone_low = zone_candles['low'].min()
-            zone_high = zone_candles['high'].max()
-            zone_range = zone_high - zone_low
-            
-            # Check if candles overlap significantly
-            avg_candle_range = (zone_candles['high'] - zone_candles['low']).mean()
-            
-            if zone_range < avg_candle_range * 2.5:  # Compressed
-                # Check no strong directional bias
-                first_close = zone_candles.iloc[0]['close']
-                last_close = zone_candles.iloc[-1]['close']
-                net_progress = abs(last_close - first_close)
-                
-                if net_progress < zone_range * 0.5:  # Minimal progress
-                    return {
-                        'zone_low': zone_low,
-                        'zone_high': zone_high,
-                        'candle_count': lookback
-                    }
-        
-        return None
+        zone_low, zone_high, candle_count = _find_origin_zone(
+            arrs['h'], arrs['l'], arrs['c'], impulse_start_idx, self.zone_candles_min, self.zone_candles_max
+        )
+        if candle_count < 0:
+            return None
+        
+        return {
+            'zone_low': zone_low,
+            'zone_high': zone_high,
+            'candle_count': candle_count
+        }
     
-    def validate_zone(self, df: pd.DataFrame, zone: Dict, impulse: Dict) -> bool:
+    def validate_zone(self, arrs: Dict, zone: Dict, impulse: Dict) -> bool:
         """
         Validate that zone was respected and price moved away significantly.
         """
         impulse_end_idx = impulse['end_idx']
+        close = arrs['c']
         
         # Check price moved away from zone
-        if impulse_end_idx >= len(df):
+        if impulse_end_idx >= len(close):
             return False
         
-        price_after_impulse = df.iloc[impulse_end_idx]['close']
+        price_after_impulse = close[impulse_end_idx]
         zone_mid = (zone['zone_low'] + zone['zone_high']) / 2
         distance = abs(price_after_impulse - zone_mid)
         zone_range = zone['zone_high'] - zone['zone_low']
@@ -146,18 +122,21 @@ class ZoneDetector:
         # Calculate ATR
         atr = self.calculate_atr(df)
         
+        # Column arrays shared by the scans below
+        arrs = self._to_arrays(df)
+        
         # Find major impulse
-        impulse = self.find_major_impulse(df, atr)
+        impulse = self.find_major_impulse(arrs, atr)
         if not impulse:
             return zones
         
         # Find origin zone
-        origin_zone = self.find_origin_zone(df, impulse['start_idx'])
+        origin_zone = self.find_origin_zone(arrs, impulse['start_idx'])
         if not origin_zone:
             return zones
         
         # Validate zone
-        if not self.validate_zone(df, origin_zone, impulse):
+        if not self.validate_zone(arrs, origin_zone, impulse):
             return zones
         
         # Create zone record
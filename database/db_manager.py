@@ -1,137 +1,305 @@
 import sqlite3
+import threading
+from collections import defaultdict
+from contextlib import contextmanager
 from datetime import datetime
 from typing import List, Dict, Optional
+from cachetools import LRUCache
+import orjson
+
+# schema.sql contents, read once per process
+_SCHEMA_CACHE: Optional[str] = None
+
+def _load_schema() -> str:
+    global _SCHEMA_CACHE
+    if _SCHEMA_CACHE is None:
+        with open('database/schema.sql', 'r') as f:
+            _SCHEMA_CACHE = f.read()
+    return _SCHEMA_CACHE
 
 class DatabaseManager:
+    ZONE_CACHE_SIZE = 4096
+    SCHEMA_TABLES = ('zones', 'decode_lists', 'watchlists')
+    
+    # Derived zone columns added after the first release; backfilled on open
+    ZONE_DERIVED_COLUMNS = ('zone_mid', 'zone_range')
+    
     def __init__(self, db_path: str):
         self.db_path = db_path
+        
+        # One long-lived connection; writes are serialized through transaction()
+        self._conn = sqlite3.connect(db_path, check_same_thread=False, isolation_level=None)
+        self._conn.row_factory = sqlite3.Row
+        self._conn.execute('PRAGMA journal_mode=WAL')
+        self._conn.execute('PRAGMA synchronous=NORMAL')
+        self._conn.execute('PRAGMA temp_store=MEMORY')
+        self._conn.execute('PRAGMA cache_size=-20000')
+        self._lock = threading.RLock()
+        
+        # Fetch Day zones are immutable, so reads are cached per (symbol, fetch_date)
+        # and dropped when this manager writes that pair. Invalidation is local to
+        # this instance: writes from another DatabaseManager or process (e.g. a
+        # scripted process_multiple_stocks run) are not seen until the entry is evicted
+        self._zone_cache = LRUCache(maxsize=self.ZONE_CACHE_SIZE)
+        
         self._init_database()
     
     def _init_database(self):
-        """Initialize database with schema"""
-        with open('database/schema.sql', 'r') as f:
-            schema = f.read()
+        """Initialize database with schema (skipped when the tables already exist)"""
+        with self._lock:
+            placeholders = ','.join('?' * len(self.SCHEMA_TABLES))
+            existing = self._conn.execute(f'''
+                SELECT COUNT(*) FROM sqlite_master
+                WHERE type = 'table' AND name IN ({placeholders})
+            ''', self.SCHEMA_TABLES).fetchone()[0]
+            
+            if existing < len(self.SCHEMA_TABLES):
+                self._conn.executescript(_load_schema())
+            
+            self._migrate_zone_columns()
+    
+    def _migrate_zone_columns(self):
+        """Add zone_mid / zone_range to zones tables created before they existed"""
+        columns = {row['name'] for row in self._conn.execute('PRAGMA table_info(zones)')}
+        missing = [column for column in self.ZONE_DERIVED_COLUMNS if column not in columns]
+        if not missing:
+            return
         
-        conn = sqlite3.connect(self.db_path)
-        conn.executescript(schema)
-        conn.commit()
-        conn.close()
+        with self.transaction() as cursor:
+            for column in missing:
+                cursor.execute(f'ALTER TABLE zones ADD COLUMN {column} REAL')
+            cursor.execute('''
+                UPDATE zones
+                SET zone_mid = (zone_low + zone_high) / 2,
+                    zone_range = zone_high - zone_low
+            ''')
+        print(f"✓ Added {', '.join(missing)} to zones")
+    
+    @contextmanager
+    def transaction(self):
+        """
+        Run statements in one transaction (single commit / fsync).
+        Yields a cursor; rolls back if the block raises.
+        """
+        with self._lock:
+            cursor = self._conn.cursor()
+            cursor.execute('BEGIN')
+            try:
+                yield cursor
+            except Exception:
+                self._conn.rollback()
+                raise
+            else:
+                self._conn.commit()
+    
+    @staticmethod
+    def _zone_params(zone_data: Dict, default_strength: str) -> tuple:
+        """Positional parameters for a zones INSERT"""
+        zone_low = zone_data['zone_low']
+        zone_high = zone_data['zone_high']
+        return (
+            zone_data['symbol'],
+            zone_data['fetch_date'],
+            zone_data['timeframe'],
+            zone_data['zone_type'],
+            zone_low,
+            zone_high,
+            (zone_low + zone_high) / 2,
+            zone_high - zone_low,
+            zone_data.get('impulse_strength', default_strength),
+            zone_data.get('impulse_start_time', None),
+            zone_data.get('impulse_end_time', None)
+        )
     
     def save_zone(self, zone_data: Dict) -> bool:
         """Save a zone from Fetch Day (immutable)"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            cursor.execute('''
-                INSERT OR IGNORE INTO zones 
-                (symbol, fetch_date, timeframe, zone_type, zone_low, zone_high, 
-                 impulse_strength, impulse_start_time, impulse_end_time)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                zone_data['symbol'],
-                zone_data['fetch_date'],
-                zone_data['timeframe'],
-                zone_data['zone_type'],
-                zone_data['zone_low'],
-                zone_data['zone_high'],
-                zone_data.get('impulse_strength', 'MEDIUM'),
-                zone_data.get('impulse_start_time', None),
-                zone_data.get('impulse_end_time', None)
-            ))
-            conn.commit()
-            return cursor.rowcount > 0
+            with self.transaction() as cursor:
+                cursor.execute('''
+                    INSERT OR IGNORE INTO zones
+                    (symbol, fetch_date, timeframe, zone_type, zone_low, zone_high, zone_mid, zone_range,
+                     impulse_strength, impulse_start_time, impulse_end_time)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', self._zone_params(zone_data, 'MEDIUM'))
+                self._invalidate_zones([zone_data])
+                return cursor.rowcount > 0
         except Exception as e:
             print(f"Error saving zone: {e}")
             return False
-        finally:
-            conn.close()
+    
+    def save_zones_bulk(self, zone_list: List[Dict]) -> int:
+        """
+        Save many Fetch Day zones in a single transaction (immutable).
+        Returns the number of zones actually inserted.
+        """
+        if not zone_list:
+            return 0
+        
+        try:
+            with self.transaction() as cursor:
+                cursor.executemany('''
+                    INSERT OR IGNORE INTO zones
+                    (symbol, fetch_date, timeframe, zone_type, zone_low, zone_high, zone_mid, zone_range,
+                     impulse_strength, impulse_start_time, impulse_end_time)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', [self._zone_params(zone, 'MEDIUM') for zone in zone_list])
+                self._invalidate_zones(zone_list)
+                return cursor.rowcount
+        except Exception as e:
+            print(f"Error saving zones: {e}")
+            return 0
+    
+    @staticmethod
+    def _zone_from_row(row: sqlite3.Row) -> Dict:
+        zone = dict(row)
+        # Convert to native Python types for JSON serialization
+        zone['id'] = int(zone['id']) if zone['id'] else None
+        zone['zone_low'] = float(zone['zone_low'])
+        zone['zone_high'] = float(zone['zone_high'])
+        
+        # Rows written by code that predates the derived columns leave them NULL
+        zone_mid = zone['zone_mid']
+        zone_range = zone['zone_range']
+        zone['zone_mid'] = float(zone_mid) if zone_mid is not None else (zone['zone_low'] + zone['zone_high']) / 2
+        zone['zone_range'] = float(zone_range) if zone_range is not None else zone['zone_high'] - zone['zone_low']
+        return zone
+    
+    @staticmethod
+    def _copy_zones(zones: List[Dict]) -> List[Dict]:
+        """Fresh dicts for callers, so mutating a returned zone can't corrupt the cache"""
+        return [dict(zone) for zone in zones]
+    
+    def _invalidate_zones(self, zone_list: List[Dict]):
+        """Drop cached reads for the (symbol, fetch_date) pairs being written"""
+        with self._lock:
+            for zone in zone_list:
+                self._zone_cache.pop((zone['symbol'], zone['fetch_date']), None)
     
     def get_zones_for_symbol(self, symbol: str, fetch_date: str) -> List[Dict]:
         """Retrieve zones for a symbol from specific Fetch Day"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        key = (symbol, fetch_date)
+        with self._lock:
+            zones = self._zone_cache.get(key)
+            if zones is None:
+                rows = self._conn.execute('''
+                    SELECT * FROM zones
+                    WHERE symbol = ? AND fetch_date = ?
+                    ORDER BY zone_type, zone_low
+                ''', key).fetchall()
+                zones = [self._zone_from_row(row) for row in rows]
+                self._zone_cache[key] = zones
         
-        cursor.execute('''
-            SELECT * FROM zones 
-            WHERE symbol = ? AND fetch_date = ?
-            ORDER BY zone_type, zone_low
-        ''', (symbol, fetch_date))
+        return self._copy_zones(zones)
+    
+    def get_zones_for_symbols(self, symbols: List[str], fetch_date: str) -> Dict[str, List[Dict]]:
+        """Retrieve zones for many symbols from the same Fetch Day in one query"""
+        zones_by_symbol = defaultdict(list)
+        if not symbols:
+            return zones_by_symbol
         
-        zones = []
-        for row in cursor.fetchall():
-            zone = dict(row)
-            # Convert to native Python types for JSON serialization
-            zone['id'] = int(zone['id']) if zone['id'] else None
-            zone['zone_low'] = float(zone['zone_low'])
-            zone['zone_high'] = float(zone['zone_high'])
-            zones.append(zone)
+        with self._lock:
+            # Serve what is cached, query the rest in one go
+            missing = []
+            for symbol in symbols:
+                cached = self._zone_cache.get((symbol, fetch_date))
+                if cached is None:
+                    missing.append(symbol)
+                elif cached:
+                    zones_by_symbol[symbol] = self._copy_zones(cached)
+            
+            if missing:
+                placeholders = ','.join('?' * len(missing))
+                rows = self._conn.execute(f'''
+                    SELECT * FROM zones
+                    WHERE fetch_date = ? AND symbol IN ({placeholders})
+                    ORDER BY zone_type, zone_low
+                ''', (fetch_date, *missing)).fetchall()
+                
+                fetched = defaultdict(list)
+                for row in rows:
+                    zone = self._zone_from_row(row)
+                    fetched[zone['symbol']].append(zone)
+                
+                for symbol in missing:
+                    self._zone_cache[(symbol, fetch_date)] = fetched[symbol]
+                    if fetched[symbol]:
+                        zones_by_symbol[symbol] = self._copy_zones(fetched[symbol])
         
-        conn.close()
-        return zones
+        return zones_by_symbol
     
     def add_decode_list(self, decode_date: str, symbols: List[str], fetch_date: str):
         """Add stocks to Decode Day list"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
-        for symbol in symbols:
-            cursor.execute('''
+        with self.transaction() as cursor:
+            cursor.executemany('''
                 INSERT OR IGNORE INTO decode_lists (decode_date, symbol, fetch_date)
                 VALUES (?, ?, ?)
-            ''', (decode_date, symbol, fetch_date))
-        
-        conn.commit()
-        conn.close()
+            ''', [(decode_date, symbol, fetch_date) for symbol in symbols])
     
     def update_zone(self, symbol: str, fetch_date: str, zone_data: Dict) -> bool:
         """Update or replace a zone for a symbol"""
-        conn = sqlite3.connect(self.db_path)
-        cursor = conn.cursor()
-        
         try:
-            # Delete existing zones
-            cursor.execute('''
-                DELETE FROM zones WHERE symbol = ? AND fetch_date = ?
-            ''', (symbol, fetch_date))
+            with self.transaction() as cursor:
+                # Delete existing zones
+                cursor.execute('''
+                    DELETE FROM zones WHERE symbol = ? AND fetch_date = ?
+                ''', (symbol, fetch_date))
+                
+                # Insert new zone
+                cursor.execute('''
+                    INSERT INTO zones
+                    (symbol, fetch_date, timeframe, zone_type, zone_low, zone_high, zone_mid, zone_range,
+                     impulse_strength, impulse_start_time, impulse_end_time)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                ''', self._zone_params(zone_data, 'MANUAL'))
+                self._zone_cache.pop((symbol, fetch_date), None)
             
-            # Insert new zone
-            cursor.execute('''
-                INSERT INTO zones 
-                (symbol, fetch_date, timeframe, zone_type, zone_low, zone_high, 
-                 impulse_strength, impulse_start_time, impulse_end_time)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            ''', (
-                zone_data['symbol'],
-                zone_data['fetch_date'],
-                zone_data['timeframe'],
-                zone_data['zone_type'],
-                zone_data['zone_low'],
-                zone_data['zone_high'],
-                zone_data.get('impulse_strength', 'MANUAL'),
-                zone_data.get('impulse_start_time', None),
-                zone_data.get('impulse_end_time', None)
-            ))
-            
-            conn.commit()
             return True
         except Exception as e:
             print(f"Error updating zone: {e}")
-            conn.rollback()
             return False
-        finally:
-            conn.close()
+    
+    def get_decode_list(self, decode_date: str) -> List[Dict]:
         """Get stocks for Execute Day monitoring"""
-        conn = sqlite3.connect(self.db_path)
-        conn.row_factory = sqlite3.Row
-        cursor = conn.cursor()
+        with self._lock:
+            rows = self._conn.execute('''
+                SELECT symbol, fetch_date FROM decode_lists
+                WHERE decode_date = ?
+            ''', (decode_date,)).fetchall()
+        
+        return [dict(row) for row in rows]
+    
+    @staticmethod
+    def _watchlist_from_row(row: sqlite3.Row) -> Dict:
+        watchlist = dict(row)
+        # Symbols are stored as a JSON array (legacy rows are comma-joined)
+        raw = watchlist['symbols']
+        watchlist['symbols'] = orjson.loads(raw) if raw.startswith('[') else raw.split(',')
+        return watchlist
+    
+    def save_watchlist(self, name: str, description: str, execute_day: str, fetch_day: str, symbols: List[str]):
+        """Save (or replace) a named watchlist"""
+        with self.transaction() as cursor:
+            cursor.execute('DELETE FROM watchlists WHERE name = ?', (name,))
+            cursor.execute('''
+                INSERT INTO watchlists (name, description, execute_day, fetch_day, symbols)
+                VALUES (?, ?, ?, ?, ?)
+            ''', (name, description, execute_day, fetch_day, orjson.dumps(symbols).decode()))
+    
+    def get_watchlists(self) -> List[Dict]:
+        """All saved watchlists, most recently updated first"""
+        with self._lock:
+            rows = self._conn.execute('SELECT * FROM watchlists ORDER BY updated_at DESC').fetchall()
         
-        cursor.execute('''
-            SELECT symbol, fetch_date FROM decode_lists
-            WHERE decode_date = ?
-        ''', (decode_date,))
+        return [self._watchlist_from_row(row) for row in rows]
+    
+    def get_watchlist(self, name: str) -> Optional[Dict]:
+        """A single watchlist by name, or None"""
+        with self._lock:
+            row = self._conn.execute('SELECT * FROM watchlists WHERE name = ?', (name,)).fetchone()
         
-        stocks = [dict(row) for row in cursor.fetchall()]
-        conn.close()
-        return stocks
+        return self._watchlist_from_row(row) if row else None
+    
+    def delete_watchlist(self, name: str):
+        """Delete a watchlist by name"""
+        with self._lock:
+            self._conn.execute('DELETE FROM watchlists WHERE name = ?', (name,))
@@ -7,6 +7,8 @@ CREATE TABLE IF NOT EXISTS zones (
     zone_type TEXT NOT NULL,
     zone_low REAL NOT NULL,
     zone_high REAL NOT NULL,
+    zone_mid REAL,
+    zone_range REAL,
     impulse_strength TEXT,
     impulse_start_time TEXT,
     impulse_end_time TEXT,